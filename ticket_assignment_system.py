@@ -11,10 +11,69 @@ This system assigns support tickets to agents based on:
 4. Agent experience and availability
 """
 
+import functools
 import json
 import re
-from datetime import datetime
-from typing import Dict, List, Tuple
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence, Set, Tuple, Union
+
+# Inflections allowed after a keyword, up to the closing word boundary. Short
+# keywords (mostly acronyms) only take a plural, and two-letter ones must be
+# the whole word, so 'ad' does not fire on 'add' or 'ads'.
+WORD_ENDINGS = ('s', 'es', 'ed', 'd', 'ing', 'ly')
+SHORT_WORD_ENDINGS = ('s', 'es')
+
+
+def keyword_endings(keyword: str) -> Tuple[str, ...]:
+    """Inflections that may follow a keyword in ticket text"""
+    if len(keyword) <= 2:
+        return ()
+    if len(keyword) == 3:
+        return SHORT_WORD_ENDINGS
+    return WORD_ENDINGS
+
+
+def keyword_ending_pattern(keyword: str) -> str:
+    """Regex for a keyword's optional inflection and the closing word boundary"""
+    endings = keyword_endings(keyword)
+    return ("(?:" + "|".join(endings) + ")?" if endings else "") + r"\b"
+
+
+def score_and_pick(skill_matrix: array, n_skills: int, req_idx: Sequence[int], base_scores: List[float],
+                   workload_scores: array, priority_bonus: float) -> Tuple[int, float]:
+    """
+    Score every agent for one ticket and return the best row and its total score
+
+    Same formula as IntelligentTicketAssignmentSystem.calculate_agent_score,
+    written as a single loop over the struct-of-arrays agent data that keeps
+    only the running best instead of a score per agent. skill_matrix is a
+    flat row-major (agents x n_skills) array of proficiencies, base_scores
+    holds the ticket-independent part (experience + availability) and
+    workload_scores the current workload score of each agent. Ties go to
+    the first agent.
+    """
+    n_required = len(req_idx)
+    best_row = 0
+    best_total = float('-inf')
+
+    for row in range(len(base_scores)):
+        offset = row * n_skills
+        skill_sum = 0
+        for j in req_idx:
+            skill_sum += skill_matrix[offset + j]
+
+        total = (base_scores[row]
+                 + (skill_sum / n_required * 10 if n_required else 0)
+                 + workload_scores[row]
+                 + priority_bonus)
+
+        if total > best_total:
+            best_row, best_total = row, total
+
+    return best_row, best_total
+
 
 class IntelligentTicketAssignmentSystem:
     """
@@ -76,44 +135,145 @@ class IntelligentTicketAssignmentSystem:
             'low': ['request', 'setup', 'new user', 'license', 'standard', 'routine']
         }
 
-    def extract_required_skills(self, text: str) -> List[str]:
-        """Extract relevant skills from ticket text using keyword matching"""
-        text_lower = text.lower()
-        relevant_skills = []
+        # Priority score for each bucket, in detection order
+        self.priority_scores = {'critical': 10, 'high': 8, 'medium': 5, 'low': 2}
 
+        # Inverted keyword -> skills map, so keywords shared by several skills
+        # (e.g. 'security', 'laptop', 'cloud') are matched only once
+        self._kw_to_skills = {}
         for skill, keywords in self.skill_keywords.items():
             for keyword in keywords:
-                if keyword in text_lower:
-                    relevant_skills.append(skill)
-                    break
+                self._kw_to_skills.setdefault(keyword, []).append(skill)
 
-        return list(set(relevant_skills))
+        # Inverted keyword -> priority score map (highest bucket wins)
+        kw_to_priority = {}
+        for bucket, keywords in self.priority_keywords.items():
+            for keyword in keywords:
+                kw_to_priority[keyword] = max(kw_to_priority.get(keyword, 0), self.priority_scores[bucket])
 
-    def calculate_priority_score(self, text: str) -> int:
-        """Calculate priority score based on urgency indicators (1-10)"""
-        text_lower = text.lower()
+        # Single-pass keyword scanner for skills and priority, built once and
+        # reused for every ticket
+        self._keyword_scanner, keywords_by_span = self._build_keyword_scanner(
+            set(self._kw_to_skills) | set(kw_to_priority)
+        )
 
-        # Critical priority indicators
-        for keyword in self.priority_keywords['critical']:
-            if keyword in text_lower:
-                return 10
+        # Column of each skill in the agent skill matrix, and its bit in a
+        # required-skills bitmask, both in declaration order
+        self._skill_names = tuple(self.skill_keywords)
+        self._skill_idx = {skill: i for i, skill in enumerate(self._skill_names)}
+        self._skill_bit = {skill: 1 << i for skill, i in self._skill_idx.items()}
+
+        # Per matched word span: bitmask of the skills it signals and the
+        # highest priority it implies
+        self._keyword_hits = {}
+        for span, aliases in keywords_by_span.items():
+            skill_mask = 0
+            for alias in aliases:
+                for skill in self._kw_to_skills.get(alias, []):
+                    skill_mask |= self._skill_bit[skill]
+            priority = max(kw_to_priority.get(alias, 0) for alias in aliases)
+            self._keyword_hits[span] = (skill_mask, priority)
+
+        # Memoized text analysis: repeated ticket texts are only scanned once
+        self._cached_analysis = functools.lru_cache(maxsize=4096)(self._scan_text)
+
+        # Agent roster tables, filled in by set_agents()
+        self._agents = []
+        self._id_to_row = {}
+        self._skill_matrix = array('b')
+        self._base_scores = []
+        self._loads = array('d')
+        self._workload_scores = array('d')
+
+    @staticmethod
+    def _build_keyword_scanner(keywords: Set[str]) -> Tuple[re.Pattern, Dict[str, Tuple[str, ...]]]:
+        """
+        Compile a set of keywords into a single-pass text scanner
+
+        Works like an Aho-Corasick automaton on top of the C regex engine: the
+        keywords are merged into a trie-shaped pattern, and a zero-width
+        lookahead visits every text position once, matching the longest
+        keyword starting there. The scanner reports the matched word span
+        (keyword plus inflection), and the returned map lists, for every
+        possible span, all keywords that match within it (e.g. 'sql server'
+        also reports a 'sql' keyword), so no overlapping hit is lost.
+
+        Keywords only match whole words, optionally followed by a plural or
+        verb ending (see keyword_endings), so 'ad' no longer fires on
+        'address' and 'port' no longer fires on 'support', while
+        'permissions' still finds 'permission'.
+        """
+        keywords = sorted(keywords)
+        keyword_patterns = {
+            keyword: re.compile(re.escape(keyword) + keyword_ending_pattern(keyword))
+            for keyword in keywords
+        }
 
-        # High priority indicators
-        for keyword in self.priority_keywords['high']:
-            if keyword in text_lower:
-                return 8
+        keywords_by_span = {}
+        trie = {}
+        for keyword in keywords:
+            for ending in ('',) + keyword_endings(keyword):
+                span = keyword + ending
+                # A span ends at a word boundary in the text, so a shorter
+                # keyword matches there exactly when it matches the span
+                keywords_by_span[span] = tuple(
+                    other for other in keywords if keyword_patterns[other].match(span)
+                )
+
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = keyword  # End-of-keyword marker
+
+        def trie_to_pattern(node: Dict) -> str:
+            # Longer keywords first, then this node's own keyword and ending
+            branches = [re.escape(char) + trie_to_pattern(child)
+                        for char, child in sorted(node.items()) if char]
+            if '' in node:
+                branches.append(keyword_ending_pattern(node['']))
+            if len(branches) == 1:
+                return branches[0]
+            return "(?:" + "|".join(branches) + ")"
+
+        return re.compile(rf"(?=\b({trie_to_pattern(trie)}))"), keywords_by_span
+
+    def analyze_text(self, title: str, description: str = "") -> Tuple[Tuple[str, ...], int]:
+        """Extract required skills and priority score (1-10), cached per exact text"""
+        skill_ids, priority = self._cached_analysis(title, description)
+        return tuple(self._skill_names[j] for j in skill_ids), priority
+
+    def _scan_text(self, title: str, description: str) -> Tuple[Tuple[int, ...], int]:
+        """
+        Extract required skill ids and priority score (1-10) in one pass over each text part
 
-        # Medium priority indicators
-        for keyword in self.priority_keywords['medium']:
-            if keyword in text_lower:
-                return 5
+        Skills are accumulated as a bitmask; the returned ids are its set bit
+        positions (ascending), which index the agent skill matrix directly.
+        """
+        skill_mask = 0
+        priority = 0
+        # Title and description are scanned in place instead of concatenated
+        for part in (title, description):
+            for span in self._keyword_scanner.findall(part.lower()):
+                keyword_mask, keyword_priority = self._keyword_hits[span]
+                skill_mask |= keyword_mask
+                if keyword_priority > priority:
+                    priority = keyword_priority
+
+        skill_ids = []
+        while skill_mask:
+            low_bit = skill_mask & -skill_mask
+            skill_ids.append(low_bit.bit_length() - 1)
+            skill_mask ^= low_bit
+
+        return tuple(skill_ids), priority or 6  # Default medium priority
 
-        # Low priority indicators
-        for keyword in self.priority_keywords['low']:
-            if keyword in text_lower:
-                return 2
+    def extract_required_skills(self, text: str) -> List[str]:
+        """Extract relevant skills from ticket text using keyword matching"""
+        return list(self.analyze_text(text)[0])
 
-        return 6  # Default medium priority
+    def calculate_priority_score(self, text: str) -> int:
+        """Calculate priority score based on urgency indicators (1-10)"""
+        return self.analyze_text(text)[1]
 
     def calculate_agent_score(self, agent: Dict, required_skills: List[str], 
                             priority_score: int, current_load: int) -> Dict:
@@ -168,38 +328,80 @@ class IntelligentTicketAssignmentSystem:
                                   score_info: Dict, priority: int) -> str:
         """Generate human-readable assignment rationale"""
 
-        # Find agent's relevant skills
-        relevant_skills = []
-        for skill in required_skills:
-            if skill in agent['skills']:
-                relevant_skills.append(f"'{skill}' ({agent['skills'][skill]})")
-
-        skill_text = ", ".join(relevant_skills[:3])  # Limit to top 3 skills
-
-        rationale_parts = []
+        # Find agent's relevant skills (limited to top 3)
+        agent_skills = agent['skills']
+        relevant_skills = [f"'{skill}' ({agent_skills[skill]})"
+                           for skill in required_skills if skill in agent_skills][:3]
 
         if relevant_skills:
-            rationale_parts.append(
-                f"Assigned to {agent['name']} ({agent['agent_id']}) "
-                f"based on expertise in {skill_text}"
-            )
+            basis = f"expertise in {', '.join(relevant_skills)}"
         else:
-            rationale_parts.append(
-                f"Assigned to {agent['name']} ({agent['agent_id']}) "
-                f"based on experience level ({agent['experience_level']})"
-            )
-
-        if score_info['workload_score'] > 15:
-            rationale_parts.append("and lower current workload")
-
-        if priority >= 8:
-            rationale_parts.append("High priority ticket requiring immediate attention")
+            basis = f"experience level ({agent['experience_level']})"
+
+        workload_text = ". and lower current workload" if score_info['workload_score'] > 15 else ""
+        priority_text = ". High priority ticket requiring immediate attention" if priority >= 8 else ""
+
+        return (f"Assigned to {agent['name']} ({agent['agent_id']}) "
+                f"based on {basis}{workload_text}{priority_text}.")
+
+    @staticmethod
+    def _parse_timestamp(value: Union[int, float, str]) -> float:
+        """Convert a creation timestamp (epoch seconds or ISO 8601 string) to epoch seconds"""
+        if isinstance(value, str):
+            parsed = datetime.fromisoformat(value)
+            # Naive times are taken as UTC so ordering never depends on the host timezone
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+        return float(value)
+
+    @staticmethod
+    def _quantize_proficiency(agent_id: str, skill: str, value: Union[int, float]) -> int:
+        """Round a skill proficiency to the nearest integer and clamp it to the int8 range"""
+        try:
+            return max(-128, min(127, round(value)))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(
+                f"Invalid proficiency {value!r} for skill '{skill}' of agent {agent_id}"
+            ) from None
+
+    def set_agents(self, agents_data: List[Dict]) -> None:
+        """
+        Load the agent roster used by assign_batch()
 
-        return ". ".join(rationale_parts) + "."
+        Rebuilds the per-agent tables (skill matrix, baseline scores) and
+        resets workloads from each agent's current_load. Call it whenever the
+        roster changes; the setup cost is amortized over every assign_batch()
+        call in between.
+        """
 
-    def assign_tickets(self, agents_data: List[Dict], tickets_data: List[Dict]) -> List[Dict]:
+        self._agents = agents_data
+        self._id_to_row = {agent['agent_id']: row for row, agent in enumerate(agents_data)}
+
+        # Agent attributes as parallel arrays (struct-of-arrays), one row per agent
+        # Skill proficiencies (0-10) quantized to one signed byte each, row-major
+        self._skill_matrix = array('b', (
+            self._quantize_proficiency(agent['agent_id'], skill, agent['skills'].get(skill, 0))
+            for agent in agents_data for skill in self._skill_idx
+        ))
+
+        # Experience and availability scores do not depend on the ticket
+        self._base_scores = [
+            min(agent['experience_level'] * 1.5, 20)
+            + (10 if agent['availability_status'] == 'Available' else 0)
+            for agent in agents_data
+        ]
+
+        # Track dynamic agent workloads during assignment, indexed by row (see
+        # _id_to_row); the workload score only changes for the agent that
+        # receives a ticket
+        # Stored as doubles so fractional loads are scored exactly as given
+        self._loads = array('d', (agent['current_load'] for agent in agents_data))
+        self._workload_scores = array('d', (max(0, (5 - load) * 6) for load in self._loads))
+
+    def assign_batch(self, tickets_data: List[Dict]) -> List[Dict]:
         """
-        Main assignment algorithm
+        Assign a batch of tickets to the agents loaded with set_agents()
 
         Process:
         1. Analyze each ticket for required skills and priority
@@ -207,60 +409,64 @@ class IntelligentTicketAssignmentSystem:
         3. For each ticket, calculate scores for all agents
         4. Assign to highest scoring agent
         5. Update agent workload for subsequent assignments
+
+        Workloads carry over between batches until set_agents() is called again.
         """
 
-        # Track dynamic agent workloads during assignment
-        agent_loads = {agent['agent_id']: agent['current_load'] for agent in agents_data}
-
-        # Prepare tickets with metadata
-        tickets_with_metadata = []
-        for ticket in tickets_data:
-            text = ticket['title'] + " " + ticket['description']
-            priority = self.calculate_priority_score(text)
-            required_skills = self.extract_required_skills(text)
-
-            tickets_with_metadata.append({
-                'ticket': ticket,
-                'priority': priority,
-                'required_skills': required_skills
-            })
-
-        # Sort by priority (highest first) then by timestamp (oldest first)
-        tickets_with_metadata.sort(
-            key=lambda x: (-x['priority'], x['ticket']['creation_timestamp'])
-        )
+        if not tickets_data:
+            return []
+        if not self._agents:
+            raise ValueError("No agents loaded; call set_agents() first")
+
+        agents_data = self._agents
+        skill_names = self._skill_names
+        loads = self._loads
+        workload_scores = self._workload_scores
+
+        # Analyze every ticket up front into parallel arrays, one entry per
+        # ticket. Tickets are independent, so only assignment is sequential.
+        analyses = list(map(self._cached_analysis,
+                            [ticket['title'] for ticket in tickets_data],
+                            [ticket['description'] for ticket in tickets_data]))
+        ticket_skill_ids = [skill_ids for skill_ids, _ in analyses]
+        priorities = array('b', (priority for _, priority in analyses))
+
+        # Fractional seconds are kept so sub-second ordering is preserved
+        timestamps = array('d', (self._parse_timestamp(ticket['creation_timestamp'])
+                                 for ticket in tickets_data))
+
+        # Sort by priority (highest first) then by timestamp (oldest first):
+        # two stable sorts on the numeric columns, least significant key first
+        neg_priorities = array('b', (-priority for priority in priorities))
+        order = sorted(range(len(tickets_data)), key=timestamps.__getitem__)
+        order.sort(key=neg_priorities.__getitem__)
 
         assignments = []
 
         # Process each ticket
-        for ticket_info in tickets_with_metadata:
-            ticket = ticket_info['ticket']
-            required_skills = ticket_info['required_skills']
-            priority = ticket_info['priority']
-
-            # Calculate scores for all agents
-            agent_scores = []
-            for agent in agents_data:
-                current_load = agent_loads[agent['agent_id']]
-                score_info = self.calculate_agent_score(
-                    agent, required_skills, priority, current_load
-                )
-
-                agent_scores.append({
-                    'agent': agent,
-                    'score_info': score_info
-                })
-
-            # Sort by total score (highest first)
-            agent_scores.sort(key=lambda x: x['score_info']['total_score'], reverse=True)
+        for i in order:
+            ticket = tickets_data[i]
+            req_idx = ticket_skill_ids[i]
+            priority = priorities[i]
 
             # Assign to best scoring agent
-            best_match = agent_scores[0]
-            best_agent = best_match['agent']
-            best_score = best_match['score_info']
+            priority_bonus = priority * 0.5 if priority >= 8 else 0
+            best_row, _ = score_and_pick(
+                self._skill_matrix, len(skill_names), req_idx, self._base_scores,
+                workload_scores, priority_bonus
+            )
+            best_agent = agents_data[best_row]
+
+            # Skill names are only needed for the winner's score breakdown
+            # and rationale
+            required_skills = [skill_names[j] for j in req_idx]
+            best_score = self.calculate_agent_score(
+                best_agent, required_skills, priority, loads[best_row]
+            )
 
             # Update agent's workload for subsequent assignments
-            agent_loads[best_agent['agent_id']] += 1
+            loads[best_row] += 1
+            workload_scores[best_row] = max(0, (5 - loads[best_row]) * 6)
 
             # Create assignment record
             assignment = {
@@ -276,14 +482,20 @@ class IntelligentTicketAssignmentSystem:
 
         return assignments
 
+    def assign_tickets(self, agents_data: List[Dict], tickets_data: List[Dict]) -> List[Dict]:
+        """Main assignment algorithm: load the agents, then assign all tickets in one batch"""
+        self.set_agents(agents_data)
+        return self.assign_batch(tickets_data)
+
 
 def main():
     """Main execution function"""
 
     # Load input data
     try:
-        with open('dataset.json', 'r') as f:
-            data = json.load(f)
+        # Read raw bytes in one go; json.loads decodes UTF-8 itself
+        with open('dataset.json', 'rb') as f:
+            data = json.loads(f.read())
     except FileNotFoundError:
         print("Error: dataset.json not found!")
         return
@@ -293,31 +505,30 @@ def main():
 
     # Generate assignments
     print("🚀 Processing ticket assignments...")
-    assignments = assignment_system.assign_tickets(data['agents'], data['tickets'])
+    assignment_system.set_agents(data['agents'])
+    assignments = assignment_system.assign_batch(data['tickets'])
 
     # Prepare output
     output_data = {
         "sample_output": assignments
     }
 
-    # Save results
+    # Save results (encode to one string and write once, instead of the
+    # many small writes json.dump issues when indenting)
     with open('output_result.json', 'w') as f:
-        json.dump(output_data, f, indent=2)
+        f.write(json.dumps(output_data, indent=2))
 
     # Print summary
     print(f"Successfully assigned {len(assignments)} tickets")
     print(f"Results saved to: output_result.json")
 
     # Quick analysis
-    agent_assignment_counts = {}
-    for assignment in assignments:
-        agent_id = assignment['assigned_agent_id']
-        agent_assignment_counts[agent_id] = agent_assignment_counts.get(agent_id, 0) + 1
+    agent_assignment_counts = Counter(assignment['assigned_agent_id'] for assignment in assignments)
+    agent_names = {agent['agent_id']: agent['name'] for agent in data['agents']}
 
     print("\nAssignment Distribution:")
     for agent_id, count in sorted(agent_assignment_counts.items()):
-        agent_name = next(agent['name'] for agent in data['agents'] if agent['agent_id'] == agent_id)
-        print(f"  {agent_id} ({agent_name}): {count} tickets")
+        print(f"  {agent_id} ({agent_names[agent_id]}): {count} tickets")
 
 
 if __name__ == "__main__":